@@ -17,6 +17,7 @@ remove_residual_venv_dirs()
 
 
 import functools
+import json
 import logging
 import os
 import secrets
@@ -772,6 +773,7 @@ class GithubRunnerCharm(CharmBase):
                     "offline": offline,
                     "unknown": unknown,
                     "runners": ", ".join(runner_names),
+                    "runner-names": json.dumps(runner_names),
                 }
             )
             return
@@ -797,6 +799,7 @@ class GithubRunnerCharm(CharmBase):
                 "offline": offline,
                 "unknown": unknown,
                 "runners": ", ".join(runner_names),
+                "runner-names": json.dumps(runner_names),
             }
         )
 
@@ -11,6 +11,7 @@ import dataclasses
 import json
 import logging
 import platform
+import random
 import re
 from enum import Enum
 from pathlib import Path
@@ -979,6 +980,23 @@ class SSHDebugConnection(BaseModel):
             )
         return ssh_debug_connections
 
+    @staticmethod
+    def choose(
+        connections: Optional[list["SSHDebugConnection"]],
+    ) -> Optional["SSHDebugConnection"]:
+        """Choose the connection for a runner to use for SSH debugging.
+
+        Args:
+            connections: The available SSH debug connections.
+
+        Returns:
+            A random connection, None if there is no connection.
+        """
+        if not connections:
+            return None
+        # The choice only spreads the runners across the servers, not used for security purposes.
+        return random.choice(connections)  # nosec B311
+
 
 class ReactiveConfig(BaseModel):
     """Represents the configuration for reactive scheduling.
@@ -7,7 +7,9 @@ Migrate to PyGithub in the future. PyGithub is still lacking some API such as
 remove token for runner.
 """
 import functools
+import hashlib
 import logging
+import time
 from datetime import datetime
 from typing import Callable, ParamSpec, TypeVar
 from urllib.error import HTTPError
@@ -34,6 +36,13 @@ ParamT = ParamSpec("ParamT")
 # Return type of the function decorated with retry
 ReturnT = TypeVar("ReturnT")
 
+# The runner applications only change on new runner releases. The time to live is kept short as
+# the runner application can contain a short lived download token.
+RUNNER_APPLICATION_CACHE_TTL = 5 * 60
+# Cached runner applications keyed by the token hash, path, architecture and OS, with the time
+# fetched. The token is part of the key as the download token is issued for the requesting token.
+_RUNNER_APPLICATIONS: dict[tuple[str, str, str, str], tuple[float, RunnerApplication]] = {}
+
 
 def catch_http_errors(func: Callable[ParamT, ReturnT]) -> Callable[ParamT, ReturnT]:
     """Catch HTTP errors and raise custom exceptions.
@@ -84,6 +93,7 @@ class GithubClient:
             token: GitHub personal token for API requests.
         """
         self._token = token
+        self._token_hash = hashlib.sha256(token.encode()).hexdigest()
         self._client = GhApi(token=self._token)
 
     @catch_http_errors
@@ -92,6 +102,8 @@ class GithubClient:
     ) -> RunnerApplication:
         """Get runner application available for download for given arch.
 
+        The result is cached for RUNNER_APPLICATION_CACHE_TTL seconds.
+
         Args:
             path: GitHub repository path in the format '<owner>/<repo>', or the GitHub organization
                 name.
@@ -105,6 +117,11 @@ class GithubClient:
         Returns:
             The runner application.
         """
+        cache_key = (self._token_hash, path.path(), arch, os)
+        cached = _RUNNER_APPLICATIONS.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < RUNNER_APPLICATION_CACHE_TTL:
+            return cached[1]
+
         runner_applications: RunnerApplicationList = []
         if isinstance(path, GithubRepo):
             runner_applications = self._client.actions.list_runner_applications_for_repo(
@@ -116,7 +133,7 @@ class GithubClient:
             )
         logger.debug("Response of runner applications list: %s", runner_applications)
         try:
-            return next(
+            runner_application = next(
                 bin
                 for bin in runner_applications
                 if bin["os"] == os and bin["architecture"] == arch
@@ -125,6 +142,8 @@ class GithubClient:
             raise RunnerBinaryError(
                 f"Unable query GitHub runner binary information for {os} {arch}"
             ) from err
+        _RUNNER_APPLICATIONS[cache_key] = (time.monotonic(), runner_application)
+        return runner_application
 
     @catch_http_errors
     def get_runner_github_info(self, path: GithubPath) -> list[SelfHostedRunner]:
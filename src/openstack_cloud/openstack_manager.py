@@ -14,10 +14,13 @@
 # pylint: disable=duplicate-code
 
 """Module for handling interactions with OpenStack."""
+import atexit
 import logging
+import os
 import secrets
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from multiprocessing import Pool
@@ -59,7 +62,7 @@ from metrics import runner as runner_metrics
 from metrics import storage as metrics_storage
 from metrics.runner import RUNNER_INSTALLED_TS_FILE_NAME
 from repo_policy_compliance_client import RepoPolicyComplianceClient
-from runner_manager import IssuedMetricEventsStats
+from runner_manager import JINJA_ENV, IssuedMetricEventsStats
 from runner_manager_type import OpenstackRunnerManagerConfig
 from runner_type import GithubPath, RunnerByHealth, RunnerGithubInfo
 from utilities import retry, set_env_var
@@ -82,6 +85,16 @@ RUNNER_LISTENER_PROCESS = "Runner.Listener"
 RUNNER_WORKER_PROCESS = "Runner.Worker"
 CREATE_SERVER_TIMEOUT = 5 * 60
 
+_ENV_TEMPLATE = "env.j2"
+_PRE_JOB_TEMPLATE = "pre-job.j2"
+_CLOUD_INIT_TEMPLATE = "openstack-userdata.sh.j2"
+# The templates rendered for each runner created.
+_RUNNER_TEMPLATES = (_ENV_TEMPLATE, _PRE_JOB_TEMPLATE, _CLOUD_INIT_TEMPLATE)
+
+# Long-lived OpenStack connections keyed by cloud name. Reusing the connection keeps the
+# keystone token and the underlying HTTP connection pool across OpenStack API calls.
+_CONNECTIONS: dict[str, OpenstackConnection] = {}
+
 
 class _PullFileError(Exception):
     """Represents an error while pulling a file from the runner instance."""
@@ -107,7 +120,7 @@ class _SSHError(Exception):
         super().__init__(reason)
 
 
-@dataclass
+@dataclass(frozen=True)
 class InstanceConfig:
     """The configuration values for creating a single runner instance.
 
@@ -121,7 +134,7 @@ class InstanceConfig:
 
     github_path: GithubPath
     image_id: str
-    labels: Iterable[str]
+    labels: tuple[str, ...]
     name: str
     registration_token: str
 
@@ -148,10 +161,52 @@ class _CloudInitUserData:
     proxies: Optional[ProxyConfig] = None
 
 
+def _get_connection(cloud_name: str) -> OpenstackConnection:
+    """Get the cached connection to the cloud, creating it if needed.
+
+    Args:
+        cloud_name: The name of the cloud in clouds.yaml to connect to.
+
+    Returns:
+        An openstack.connection.Connection object.
+    """
+    if (conn := _CONNECTIONS.get(cloud_name)) is None:
+        conn = openstack.connect(cloud=cloud_name)
+        _CONNECTIONS[cloud_name] = conn
+    return conn
+
+
+def _close_connection(cloud_name: str, conn: openstack.connection.Connection) -> None:
+    """Close an OpenStack connection removed from the cache.
+
+    Args:
+        cloud_name: The name of the cloud the connection is for.
+        conn: The connection to close.
+    """
+    try:
+        conn.close()
+    except SDKException:
+        logger.warning("Failed to close OpenStack connection to %s", cloud_name)
+
+
+def close_connections() -> None:
+    """Close all cached OpenStack connections."""
+    while _CONNECTIONS:
+        _close_connection(*_CONNECTIONS.popitem())
+
+
+# The HTTP sessions of the cached connections must not be shared with forked processes, e.g.,
+# the process pool used to create runners.
+os.register_at_fork(after_in_child=_CONNECTIONS.clear)
+atexit.register(close_connections)
+
+
 @contextmanager
 def _create_connection(cloud_config: dict[str, dict]) -> Iterator[openstack.connection.Connection]:
     """Create a connection context managed object, to be used within with statements.
 
+    The connection is cached per cloud and reused across calls. See close_connections.
+
     This method should be called with a valid cloud_config. See _validate_cloud_config.
     Also, this method assumes that the clouds.yaml exists on ~/.config/openstack/clouds.yaml.
     See charm_state.py _write_openstack_config_to_disk.
@@ -160,25 +215,29 @@ def _create_connection(cloud_config: dict[str, dict]) -> Iterator[openstack.conn
         cloud_config: The configuration in clouds.yaml format to apply.
 
     Raises:
-        OpenStackError: if the credentials provided is not authorized.
+        OpenStackError: if no cloud is defined or the credentials provided is not authorized.
 
     Yields:
         An openstack.connection.Connection object.
     """
-    clouds = list(cloud_config["clouds"].keys())
+    clouds = cloud_config["clouds"]
+    if (cloud_name := next(iter(clouds), None)) is None:
+        raise OpenStackError("No cloud defined in clouds.yaml")
     if len(clouds) > 1:
         logger.warning("Multiple clouds defined in clouds.yaml. Using the first one to connect.")
-    cloud_name = clouds[0]
 
     # api documents that keystoneauth1.exceptions.MissingRequiredOptions can be raised but
     # I could not reproduce it. Therefore, no catch here for such exception.
     try:
-        with openstack.connect(cloud=cloud_name) as conn:
-            conn.authorize()
-            yield conn
+        conn = _get_connection(cloud_name)
+        conn.authorize()
+        yield conn
     # pylint thinks this isn't an exception, but does inherit from Exception class.
     except openstack.exceptions.HttpException as exc:  # pylint: disable=bad-exception-cause
         logger.exception("OpenStack API call failure")
+        # Drop the connection so that the next call authenticates from scratch.
+        if (stale_conn := _CONNECTIONS.pop(cloud_name, None)) is not None:
+            _close_connection(cloud_name, stale_conn)
         raise OpenStackError("Failed OpenStack API call") from exc
 
 
@@ -209,7 +268,7 @@ def create_instance_config(  # pylint: disable=too-many-arguments
     return InstanceConfig(
         github_path=path,
         image_id=image_id,
-        labels=labels,
+        labels=tuple(labels),
         name=f"{app_name}-{unit_num}-{suffix}",
         registration_token=registration_token,
     )
@@ -232,10 +291,10 @@ def _generate_runner_env(
     Returns:
         The .env contents to be loaded by Github runner.
     """
-    return templates_env.get_template("env.j2").render(
+    return templates_env.get_template(_ENV_TEMPLATE).render(
         pre_job_script=str(PRE_JOB_SCRIPT),
         dockerhub_mirror=dockerhub_mirror or "",
-        ssh_debug_info=(secrets.choice(ssh_debug_connections) if ssh_debug_connections else None),
+        ssh_debug_info=SSHDebugConnection.choose(ssh_debug_connections),
         # Proxies are handled by aproxy.
         proxies={},
     )
@@ -262,7 +321,7 @@ def _generate_cloud_init_userdata(
         runner_group = instance_config.github_path.group
 
     aproxy_address = proxies.aproxy_address if proxies is not None else None
-    return templates_env.get_template("openstack-userdata.sh.j2").render(
+    return templates_env.get_template(_CLOUD_INIT_TEMPLATE).render(
         github_url=f"https://github.com/{instance_config.github_path.path()}",
         runner_group=runner_group,
         token=instance_config.registration_token,
@@ -433,11 +492,22 @@ class OpenstackRunnerManager:
 
         logger.debug("Found openstack instances: %s", openstack_instances)
 
-        for instance in openstack_instances:
-            if not OpenstackRunnerManager._health_check(conn=conn, server_name=instance.name):
-                unhealthy_runner.append(instance.name)
-            else:
-                healthy_runner.append(instance.name)
+        if not openstack_instances:
+            return RunnerByHealth(healthy=(), unhealthy=())
+
+        # The health checks are bounded by SSH network round trips, run them concurrently.
+        with ThreadPoolExecutor(max_workers=min(len(openstack_instances), 10)) as executor:
+            health_checks = executor.map(
+                lambda instance: OpenstackRunnerManager._health_check(
+                    conn=conn, server_name=instance.name
+                ),
+                openstack_instances,
+            )
+            for instance, healthy in zip(openstack_instances, health_checks):
+                if not healthy:
+                    unhealthy_runner.append(instance.name)
+                else:
+                    healthy_runner.append(instance.name)
 
         return RunnerByHealth(healthy=tuple(healthy_runner), unhealthy=tuple(unhealthy_runner))
 
@@ -450,10 +520,14 @@ class OpenstackRunnerManager:
         Returns:
             List of OpenStack instances.
         """
+        # The name filter is a regular expression matched by the server, this avoids fetching the
+        # servers of other applications sharing the OpenStack project. The prefix is checked
+        # again locally as the regular expression support depends on the database of Nova.
+        servers = cast(
+            list[Server], conn.list_servers(filters={"name": f"^{self.instance_name}-"})
+        )
         return [
-            instance
-            for instance in cast(list[Server], conn.list_servers())
-            if instance.name.startswith(f"{self.instance_name}-")
+            instance for instance in servers if instance.name.startswith(f"{self.instance_name}-")
         ]
 
     @staticmethod
@@ -531,7 +605,7 @@ class OpenstackRunnerManager:
         return True
 
     @staticmethod
-    @retry(tries=3, delay=5, max_delay=60, backoff=2, local_logger=logger)
+    @retry(tries=3, delay=5, max_delay=60, backoff=2, jitter=(0.5, 1.5), local_logger=logger)
     def _get_ssh_connection(
         conn: OpenstackConnection, server_name: str, timeout: int = 30
     ) -> SshConnection:
@@ -642,18 +716,14 @@ class OpenstackRunnerManager:
             RunnerCreateError: Unable to create the OpenStack runner.
         """
         ts_now = time.time()
-        environment = jinja2.Environment(
-            loader=jinja2.FileSystemLoader("templates"), autoescape=True
-        )
-
         env_contents = _generate_runner_env(
-            templates_env=environment,
+            templates_env=JINJA_ENV,
             dockerhub_mirror=args.config.dockerhub_mirror,
             ssh_debug_connections=args.config.charm_state.ssh_debug_connections,
         )
 
         pre_job_contents = OpenstackRunnerManager._render_pre_job_contents(
-            charm_state=args.config.charm_state, templates_env=environment
+            charm_state=args.config.charm_state, templates_env=JINJA_ENV
         )
 
         instance_config = create_instance_config(
@@ -672,12 +742,11 @@ class OpenstackRunnerManager:
             proxies=args.config.charm_state.proxy_config,
         )
         cloud_userdata_str = _generate_cloud_init_userdata(
-            templates_env=environment,
+            templates_env=JINJA_ENV,
             cloud_init_userdata=cloud_user_data,
         )
 
         with _create_connection(cloud_config=args.cloud_config) as conn:
-            OpenstackRunnerManager._ensure_security_group(conn)
             OpenstackRunnerManager._setup_runner_keypair(conn, instance_config.name)
 
             logger.info("Creating runner %s", instance_config.name)
@@ -765,7 +834,9 @@ class OpenstackRunnerManager:
                     "do_repo_policy_check": True,
                 }
             )
-        pre_job_contents = templates_env.get_template("pre-job.j2").render(pre_job_contents_dict)
+        pre_job_contents = templates_env.get_template(_PRE_JOB_TEMPLATE).render(
+            pre_job_contents_dict
+        )
         return pre_job_contents
 
     @staticmethod
@@ -957,10 +1028,18 @@ class OpenstackRunnerManager:
             runner["name"]: runner["id"]
             for runner in self._github.get_runner_github_info(self._config.path)
         }
-        for instance_name in instance_names:
-            if num_to_remove < 1:
-                break
+        instances_to_remove = list(instance_names)
+        if num_to_remove < len(instances_to_remove):
+            instances_to_remove = instances_to_remove[: int(num_to_remove)]
+        if not instances_to_remove:
+            return
 
+        def _remove(instance_name: str) -> None:
+            """Remove one runner and its keys.
+
+            Args:
+                instance_name: The Openstack server name to delete.
+            """
             github_id = name_to_github_id.get(instance_name, None)
             self._remove_one_runner(conn, instance_name, github_id, remove_token)
 
@@ -971,7 +1050,16 @@ class OpenstackRunnerManager:
             except openstack.exceptions.SDKException:
                 logger.exception("Unable to delete OpenStack keypair %s", instance_name)
             OpenstackRunnerManager._get_key_path(instance_name).unlink(missing_ok=True)
-            num_to_remove -= 1
+
+        # The deletion of servers is waited on, remove the runners concurrently to overlap the
+        # waiting.
+        with ThreadPoolExecutor(max_workers=min(len(instances_to_remove), 10)) as executor:
+            futures = [
+                executor.submit(_remove, instance_name) for instance_name in instances_to_remove
+            ]
+        # All removals have finished on exiting the executor, raise the first failure if any.
+        for future in futures:
+            future.result()
 
     def _remove_one_runner(
         self,
@@ -1341,11 +1429,15 @@ class OpenstackRunnerManager:
         # This is not calculated due to there might be removal failures.
         servers = self._get_openstack_instances(conn)
         delta = quantity - len(servers)
-        registration_token = self._github.get_runner_registration_token(path=self._config.path)
 
         # Spawn new runners
         if delta > 0:
             logger.info("Creating %s OpenStack runners", delta)
+            # A registration token is only needed for new runners, and can be shared by them.
+            registration_token = self._github.get_runner_registration_token(path=self._config.path)
+            # The security group is shared by all runners, ensure it once rather than on each
+            # runner creation.
+            OpenstackRunnerManager._ensure_security_group(conn)
             args = [
                 OpenstackRunnerManager._CreateRunnerArgs(
                     app_name=self.app_name,
@@ -1356,6 +1448,9 @@ class OpenstackRunnerManager:
                 )
                 for _ in range(delta)
             ]
+            # Compile the templates before forking, so the worker processes inherit them.
+            for template in _RUNNER_TEMPLATES:
+                JINJA_ENV.get_template(template)
             with Pool(processes=min(delta, 10)) as pool:
                 pool.map(
                     func=OpenstackRunnerManager._create_runner,
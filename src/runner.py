@@ -10,16 +10,17 @@ The `RunnerManager` class from `runner_manager.py` creates and manages a
 collection of `Runner` instances.
 """
 
+import functools
 import json
 import logging
 import pathlib
-import secrets
 import textwrap
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, NamedTuple, Optional, Sequence
 
+import jinja2
 import yaml
 
 import shared_fs
@@ -57,6 +58,46 @@ METRICS_EXCHANGE_PATH = Path("/metrics-exchange")
 DIAG_DIR_PATH = Path("/home/ubuntu/github-runner/_diag")
 
 
+@functools.lru_cache(maxsize=8)
+def _render_docker_proxy_assets(
+    templates_env: jinja2.Environment,
+    http: Optional[str],
+    https: Optional[str],
+    no_proxy: Optional[str],
+) -> tuple[str, str]:
+    """Render the docker daemon and docker client proxy configurations.
+
+    The results are cached as the proxy settings are the same for all runners.
+
+    Args:
+        templates_env: The jinja template environment.
+        http: HTTP proxy URL.
+        https: HTTPS proxy URL.
+        no_proxy: The comma separated URLs to not go through proxy.
+
+    Returns:
+        The systemd drop-in for the docker service and the docker client config.json contents.
+    """
+    docker_service_proxy_content = templates_env.get_template("systemd-docker-proxy.j2").render(
+        proxies={"http": http, "https": https, "no_proxy": no_proxy}
+    )
+    docker_client_proxy = {
+        "proxies": {
+            "default": {
+                key: value
+                for key, value in (
+                    ("httpProxy", http),
+                    ("httpsProxy", https),
+                    ("noProxy", no_proxy),
+                )
+                if value
+            }
+        }
+    }
+    docker_client_proxy_content = json.dumps(docker_client_proxy)
+    return docker_service_proxy_content, docker_client_proxy_content
+
+
 class Snap(NamedTuple):
     """This class represents a snap installation.
 
@@ -692,8 +733,11 @@ class Runner:
 
         # Creating directory and putting the file are idempotent, and can be retried.
         logger.info("Adding proxy setting to the runner.")
-        docker_proxy_contents = self._clients.jinja.get_template("systemd-docker-proxy.j2").render(
-            proxies=self.config.proxies
+        docker_proxy_contents, docker_client_proxy_content = _render_docker_proxy_assets(
+            self._clients.jinja,
+            self.config.proxies.http,
+            self.config.proxies.https,
+            self.config.proxies.no_proxy,
         )
         # Set docker daemon proxy config
         docker_service_path = Path("/etc/systemd/system/docker.service.d")
@@ -702,21 +746,6 @@ class Runner:
         self._put_file(str(docker_service_proxy), docker_proxy_contents)
         self.instance.execute(["systemctl", "daemon-reload"])
         self.instance.execute(["systemctl", "restart", "docker"])
-        # Set docker client proxy config
-        docker_client_proxy = {
-            "proxies": {
-                "default": {
-                    key: value
-                    for key, value in (
-                        ("httpProxy", self.config.proxies.http),
-                        ("httpsProxy", self.config.proxies.https),
-                        ("noProxy", self.config.proxies.no_proxy),
-                    )
-                    if value
-                }
-            }
-        }
-        docker_client_proxy_content = json.dumps(docker_client_proxy)
         # Configure the docker client for root user and ubuntu user.
         self._put_file("/root/.docker/config.json", docker_client_proxy_content)
         self._put_file("/home/ubuntu/.docker/config.json", docker_client_proxy_content)
@@ -767,11 +796,7 @@ class Runner:
         # As the user already has sudo access, this does not give the user any additional access.
         self.instance.execute(["/usr/bin/sudo", "chmod", "777", "/usr/local/bin"])
 
-        selected_ssh_connection: SSHDebugConnection | None = (
-            secrets.choice(self.config.ssh_debug_connections)
-            if self.config.ssh_debug_connections
-            else None
-        )
+        selected_ssh_connection = SSHDebugConnection.choose(self.config.ssh_debug_connections)
         logger.info("SSH Debug info: %s", selected_ssh_connection)
         # Load `/etc/environment` file.
         environment_contents = self._clients.jinja.get_template("environment.j2").render(
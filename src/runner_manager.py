@@ -53,6 +53,12 @@ logger = logging.getLogger(__name__)
 
 BUILD_IMAGE_SCRIPT_FILENAME = Path("scripts/build-lxd-image.sh")
 
+# Shared by all runner managers, the compiled templates are cached by the environment. The
+# templates are part of the charm and do not change, hence no need to check for reload.
+JINJA_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader("templates"), autoescape=True, auto_reload=False
+)
+
 IssuedMetricEventsStats = dict[Type[metric_events.Event], int]
 
 
@@ -104,7 +110,7 @@ class RunnerManager:
 
         self._clients = RunnerManagerClients(
             GithubClient(token=self.config.token),
-            jinja2.Environment(loader=jinja2.FileSystemLoader("templates"), autoescape=True),
+            JINJA_ENV,
             LxdClient(),
             RepoPolicyComplianceClient("http://127.0.0.1:8080", self.config.service_token),
         )
@@ -7,6 +7,7 @@ import functools
 import logging
 import os
 import pathlib
+import random
 import subprocess  # nosec B404
 import time
 from typing import Any, Callable, Optional, Sequence, Type, TypeVar
@@ -31,6 +32,7 @@ def retry(  # pylint: disable=too-many-arguments
     delay: float = 0,
     max_delay: Optional[float] = None,
     backoff: float = 1,
+    jitter: Optional[tuple[float, float]] = None,
     local_logger: logging.Logger = logger,
 ) -> Callable[[Callable[ParamT, ReturnT]], Callable[ParamT, ReturnT]]:
     """Parameterize the decorator for adding retry to functions.
@@ -41,6 +43,8 @@ def retry(  # pylint: disable=too-many-arguments
         delay: Time in seconds to wait between retry.
         max_delay: Max time in seconds to wait between retry.
         backoff: Factor to increase the delay by each retry.
+        jitter: Range of the random factor to multiply each wait by. Spreads out the retries of
+            concurrent callers failing at the same time.
         local_logger: Logger for logging.
 
     Returns:
@@ -87,13 +91,14 @@ def retry(  # pylint: disable=too-many-arguments
                             local_logger.exception("Retry limit of %s exceed: %s", tries, err)
                         raise
 
+                    # The randomness is not used for security purposes.
+                    wait = current_delay * (random.uniform(*jitter) if jitter else 1)  # nosec B311
+
                     if local_logger is not None:
-                        local_logger.warning(
-                            "Retrying error in %s seconds: %s", current_delay, err
-                        )
+                        local_logger.warning("Retrying error in %s seconds: %s", wait, err)
                         local_logger.debug("Error to be retried:", stack_info=True)
 
-                    time.sleep(current_delay)
+                    time.sleep(wait)
 
                     current_delay *= backoff
 
@@ -2,12 +2,13 @@
 # See LICENSE file for licensing details.
 
 """Fixtures for github runner charm integration tests."""
+import functools
 import logging
+import os
 import random
 import secrets
 import string
 from pathlib import Path
-from time import sleep
 from typing import Any, AsyncIterator, Generator, Iterator, Optional
 
 import nest_asyncio
@@ -16,7 +17,7 @@ import pytest
 import pytest_asyncio
 import yaml
 from git import Repo
-from github import Github, GithubException
+from github import Github, GithubException, UnknownObjectException
 from github.Branch import Branch
 from github.Repository import Repository
 from juju.application import Application
@@ -47,11 +48,28 @@ from tests.integration.helpers.common import (
 from tests.integration.helpers.lxd import LXDInstanceHelper, ensure_charm_has_runner
 from tests.integration.helpers.openstack import OpenStackInstanceHelper, PrivateEndpointConfigs
 from tests.status_name import ACTIVE
+from utilities import retry
 
 # The following line is required because we are using request.getfixturevalue in conjunction
 # with pytest-asyncio. See https://github.com/pytest-dev/pytest-asyncio/issues/112
 nest_asyncio.apply()
 
+# Use the libyaml based loader if PyYAML is built with it.
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml(content: str | bytes) -> Any:
+    """Parse YAML content, the result is cached as the content does not change in a session.
+
+    Args:
+        content: The YAML content. Bytes are passed to the loader as is without decoding.
+
+    Returns:
+        The parsed YAML. Should not be modified as it is shared between callers.
+    """
+    return yaml.load(content, Loader=_YamlSafeLoader)  # nosec B506
+
 
 @pytest_asyncio.fixture(scope="module", name="instance_type")
 async def instance_type_fixture(
@@ -67,11 +85,11 @@ async def instance_type_fixture(
         return InstanceType.LOCAL_LXD
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def metadata() -> dict[str, Any]:
     """Metadata information of the charm."""
     metadata = Path("./metadata.yaml")
-    data = yaml.safe_load(metadata.read_text())
+    data = _load_yaml(metadata.read_bytes())
     return data
 
 
@@ -88,7 +106,7 @@ def app_name(existing_app: Optional[str]) -> str:
     return existing_app or f"integration-id{secrets.token_hex(2)}"
 
 
-@pytest.fixture(scope="module", name="openstack_clouds_yaml")
+@pytest.fixture(scope="session", name="openstack_clouds_yaml")
 def openstack_clouds_yaml_fixture(pytestconfig: pytest.Config) -> str | None:
     """The openstack clouds yaml config."""
     return pytestconfig.getoption("--openstack-clouds-yaml")
@@ -110,7 +128,7 @@ def charm_file(
     return charm_path_str
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def path(pytestconfig: pytest.Config) -> str:
     """Configured path setting."""
     path = pytestconfig.getoption("--path")
@@ -126,9 +144,8 @@ def token(pytestconfig: pytest.Config) -> str:
     """Configured token setting."""
     token = pytestconfig.getoption("--token")
     assert token, "Please specify the --token command line option"
-    tokens = {token.strip() for token in token.split(",")}
-    random_token = random.choice(list(tokens))
-    return random_token
+    tokens = [token.strip() for token in token.split(",") if token.strip()]
+    return random.choice(tokens)
 
 
 @pytest.fixture(scope="module")
@@ -143,21 +160,21 @@ def token_alt(pytestconfig: pytest.Config, token: str) -> str:
     return token_alt
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def http_proxy(pytestconfig: pytest.Config) -> str:
     """Configured http_proxy setting."""
     http_proxy = pytestconfig.getoption("--http-proxy")
     return "" if http_proxy is None else http_proxy
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def https_proxy(pytestconfig: pytest.Config) -> str:
     """Configured https_proxy setting."""
     https_proxy = pytestconfig.getoption("--https-proxy")
     return "" if https_proxy is None else https_proxy
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def no_proxy(pytestconfig: pytest.Config) -> str:
     """Configured no_proxy setting."""
     no_proxy = pytestconfig.getoption("--no-proxy")
@@ -185,7 +202,7 @@ def openstack_no_proxy_fixture(pytestconfig: pytest.Config) -> str:
     return "" if no_proxy is None else no_proxy
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def loop_device(pytestconfig: pytest.Config) -> Optional[str]:
     """Configured loop_device setting."""
     return pytestconfig.getoption("--loop-device")
@@ -283,9 +300,16 @@ def openstack_connection_fixture(
     clouds_yaml_contents: str, app_name: str
 ) -> Generator[Connection, None, None]:
     """The openstack connection instance."""
-    clouds_yaml = yaml.safe_load(clouds_yaml_contents)
+    clouds_yaml = _load_yaml(clouds_yaml_contents)
     clouds_yaml_path = Path.cwd() / "clouds.yaml"
-    clouds_yaml_path.write_text(data=clouds_yaml_contents, encoding="utf-8")
+    clouds_yaml_bytes = clouds_yaml_contents.encode("utf-8")
+    # Skip the write when the file is up to date, e.g. from a previous test module.
+    if not clouds_yaml_path.exists() or clouds_yaml_path.read_bytes() != clouds_yaml_bytes:
+        # Write to a temporary file and rename, so concurrent test runs in the same directory
+        # never read a partially written file.
+        tmp_clouds_yaml_path = clouds_yaml_path.with_name(f".clouds.yaml.{os.getpid()}")
+        tmp_clouds_yaml_path.write_bytes(clouds_yaml_bytes)
+        tmp_clouds_yaml_path.replace(clouds_yaml_path)
     first_cloud = next(iter(clouds_yaml["clouds"].keys()))
     with openstack.connect(first_cloud) as connection:
         yield connection
@@ -344,7 +368,7 @@ async def app_no_runner(
             no_proxy=no_proxy,
             reconcile_interval=60,
         )
-    await model.wait_for_idle(apps=[application.name], status=ACTIVE)
+    await model.wait_for_idle(apps=[application.name], status=ACTIVE, timeout=10 * 60)
     return application
 
 
@@ -588,16 +612,15 @@ def forked_github_repository(
     """Create a fork for a GitHub repository."""
     forked_repository = github_repository.create_fork(name=f"test-{github_repository.name}")
 
-    # Wait for repo to be ready
-    for _ in range(10):
-        try:
-            sleep(10)
-            forked_repository.get_branches()
-            break
-        except GithubException:
-            pass
-    else:
-        assert False, "timed out whilst waiting for repository creation"
+    # Wait for repo to be ready, the jitter spreads out the polling of parallel test runs.
+    @retry(
+        exception=GithubException, tries=10, delay=1, max_delay=30, backoff=2, jitter=(0.5, 1.5)
+    )
+    def _wait_for_repository() -> None:
+        """Check the forked repository is ready."""
+        forked_repository.get_branches()
+
+    _wait_for_repository()
 
     return forked_repository
 
@@ -616,19 +639,24 @@ def forked_github_branch(
         ref=f"refs/heads/{branch_name}", sha=main_branch.commit.sha
     )
 
-    for _ in range(10):
-        try:
-            branch = forked_github_repository.get_branch(branch_name)
-            break
-        except GithubException as err:
-            if err.status == 404:
-                sleep(5)
-                continue
-            raise
-    else:
-        assert (
-            False
-        ), "Failed to get created branch in fork repo, the issue with GitHub or network."
+    # A 404 is raised until the created branch is available in the fork.
+    @retry(
+        exception=UnknownObjectException,
+        tries=10,
+        delay=1,
+        max_delay=30,
+        backoff=2,
+        jitter=(0.5, 1.5),
+    )
+    def _get_branch() -> Branch:
+        """Get the created branch in the forked repository.
+
+        Returns:
+            The created branch.
+        """
+        return forked_github_repository.get_branch(branch_name)
+
+    branch = _get_branch()
 
     yield branch
 
@@ -725,18 +753,20 @@ async def app_for_metric_fixture(
             channel="latest/edge",
         )
         await model.relate(f"{basic_app.name}:cos-agent", f"{grafana_agent.name}:cos-agent")
-        await model.wait_for_idle(apps=[basic_app.name], status=ACTIVE)
-        await model.wait_for_idle(apps=[grafana_agent.name])
+        await model.wait_for_idle(apps=[basic_app.name], status=ACTIVE, timeout=20 * 60)
+        await model.wait_for_idle(apps=[grafana_agent.name], timeout=20 * 60)
 
     yield basic_app
 
 
 @pytest_asyncio.fixture(scope="module", name="mongodb")
 async def mongodb_fixture(model: Model, existing_app: str | None) -> Application:
-    """Deploy MongoDB."""
+    """Deploy MongoDB.
+
+    The deployment is not waited on, it settles while the dependent fixtures deploy the charm.
+    """
     if not existing_app:
         mongodb = await model.deploy(MONGODB_APP_NAME, channel="6/edge")
-        await model.wait_for_idle(apps=[MONGODB_APP_NAME], status=ACTIVE)
     else:
         mongodb = model.applications["mongodb"]
     return mongodb
@@ -745,16 +775,19 @@ async def mongodb_fixture(model: Model, existing_app: str | None) -> Application
 @pytest_asyncio.fixture(scope="module", name="app_for_reactive")
 async def app_for_reactive_fixture(
     model: Model,
-    basic_app: Application,
     mongodb: Application,
+    basic_app: Application,
     existing_app: Optional[str],
 ) -> Application:
-    """Application for testing reactive."""
+    """Application for testing reactive.
+
+    MongoDB is requested before the charm so both deployments progress concurrently.
+    """
     if not existing_app:
         await model.relate(f"{basic_app.name}:mongodb", f"{mongodb.name}:database")
 
     await basic_app.set_config({VIRTUAL_MACHINES_CONFIG_NAME: "1"})
-    await model.wait_for_idle(apps=[basic_app.name, mongodb.name], status=ACTIVE)
+    await model.wait_for_idle(apps=[basic_app.name, mongodb.name], status=ACTIVE, timeout=30 * 60)
 
     return basic_app
 
@@ -3,6 +3,7 @@
 
 """Utilities for integration test."""
 
+import asyncio
 import inspect
 import logging
 import pathlib
@@ -47,6 +48,7 @@ DISPATCH_E2E_TEST_RUN_WORKFLOW_FILENAME = "e2e_test_run.yaml"
 DISPATCH_E2E_TEST_RUN_OPENSTACK_WORKFLOW_FILENAME = "e2e_test_run_openstack.yaml"
 
 MONGODB_APP_NAME = "mongodb"
+RUNNER_BIN_PATH = str(RunnerManager.runner_bin_path)
 DEFAULT_RUNNER_CONSTRAINTS = {"root-disk": 15}
 
 logger = logging.getLogger(__name__)
@@ -93,7 +95,7 @@ async def check_runner_binary_exists(unit: Unit) -> bool:
     Returns:
         Whether the runner binary file exists in the charm.
     """
-    return_code, _, _ = await run_in_unit(unit, f"test -f {RunnerManager.runner_bin_path}")
+    return_code, _, _ = await run_in_unit(unit, f"test -f {RUNNER_BIN_PATH}")
     return return_code == 0
 
 
@@ -141,11 +143,11 @@ async def remove_runner_bin(unit: Unit) -> None:
     Args:
         unit: Unit instance to check for the LXD profile.
     """
-    await run_in_unit(unit, f"rm {RunnerManager.runner_bin_path}")
-
-    # No file should exists under with the filename.
-    return_code, _, _ = await run_in_unit(unit, f"test -f {RunnerManager.runner_bin_path}")
-    assert return_code != 0
+    # Remove and check in a single command, no file should exist under the filename.
+    return_code, _, stderr = await run_in_unit(
+        unit, f"rm -f {RUNNER_BIN_PATH} && test ! -f {RUNNER_BIN_PATH}"
+    )
+    assert return_code == 0, f"Failed to remove runner binary: {stderr}"
 
 
 def on_juju_2() -> bool:
@@ -210,7 +212,7 @@ async def reconcile(app: Application, model: Model) -> None:
     """
     action = await app.units[0].run_action("reconcile-runners")
     await action.wait()
-    await model.wait_for_idle(apps=[app.name], status=ACTIVE)
+    await model.wait_for_idle(apps=[app.name], status=ACTIVE, timeout=10 * 60)
 
 
 async def deploy_github_runner_charm(
@@ -431,7 +433,9 @@ S = Callable[P, R] | Callable[P, Awaitable[R]]
 async def wait_for(
     func: S,
     timeout: int | float = 300,
-    check_interval: int = 10,
+    check_interval: int | float = 10,
+    backoff: float = 1,
+    max_check_interval: int | float | None = None,
 ) -> R:
     """Wait for function execution to become truthy.
 
@@ -439,6 +443,8 @@ async def wait_for(
         func: A callback function to wait to return a truthy value.
         timeout: Time in seconds to wait for function result to become truthy.
         check_interval: Time in seconds to wait between ready checks.
+        backoff: Factor to increase the check interval by after each check.
+        max_check_interval: Max time in seconds to wait between ready checks.
 
     Raises:
         TimeoutError: if the callback function did not return a truthy value within timeout.
@@ -456,7 +462,10 @@ async def wait_for(
             if result := func():
                 return cast(R, result)
         logger.info("Wait for condition not met, sleeping %s", check_interval)
-        time.sleep(check_interval)
+        await asyncio.sleep(check_interval)
+        check_interval *= backoff
+        if max_check_interval is not None:
+            check_interval = min(check_interval, max_check_interval)
 
     # final check before raising TimeoutError.
     if is_awaitable:
@@ -105,13 +105,16 @@ async def get_runner_names(unit: Unit) -> tuple[str, ...]:
     return tuple(runner["name"] for runner in lxc_instance if runner["name"] != "builder")
 
 
-async def wait_till_num_of_runners(unit: Unit, num: int, timeout: int = 10 * 60) -> None:
+async def wait_till_num_of_runners(
+    unit: Unit, num: int, timeout: int = 10 * 60, check_interval: int | float = 5
+) -> None:
     """Wait and check the number of runners.
 
     Args:
         unit: Unit instance to check for the LXD profile.
         num: Number of runner instances to check for.
         timeout: Number of seconds to wait for the runners.
+        check_interval: Number of seconds to wait before the first recheck of the runners.
     """
 
     async def get_lxc_instances() -> None | list[dict]:
@@ -137,7 +140,13 @@ async def wait_till_num_of_runners(unit: Unit, num: int, timeout: int = 10 * 60)
             return False
         return len(lxc_instances) == num
 
-    await wait_for(is_desired_num_runners, timeout=timeout, check_interval=30)
+    await wait_for(
+        is_desired_num_runners,
+        timeout=timeout,
+        check_interval=check_interval,
+        backoff=2,
+        max_check_interval=30,
+    )
 
     instances = await get_lxc_instances()
     if not instances:
@@ -65,8 +65,8 @@ async def test_dispatch_workflow_failure(
         await model.relate(
             f"{app_with_forked_repo.name}:cos-agent", f"{grafana_agent.name}:cos-agent"
         )
-        await model.wait_for_idle(apps=[app_with_forked_repo.name], status=ACTIVE)
-        await model.wait_for_idle(apps=[grafana_agent.name])
+        await model.wait_for_idle(apps=[app_with_forked_repo.name], status=ACTIVE, timeout=10 * 60)
+        await model.wait_for_idle(apps=[grafana_agent.name], timeout=10 * 60)
         await instance_helper.ensure_charm_has_runner(app_with_forked_repo)
 
     workflow = forked_github_repository.get_workflow(
@@ -2,6 +2,7 @@
 # See LICENSE file for licensing details.
 
 """Integration tests for github-runner charm containing one runner."""
+import hashlib
 from typing import AsyncIterator
 
 import pytest
@@ -79,15 +80,20 @@ async def test_token_config_changed(model: Model, app: Application, token_alt: s
     await app.set_config({TOKEN_CONFIG_NAME: token_alt})
     await model.wait_for_idle(status=ACTIVE, timeout=30 * 60)
 
+    # Compare the hash of the configured token, to avoid the token in the command output.
     return_code, stdout, stderr = await run_in_unit(
-        unit, "cat /etc/systemd/system/repo-policy-compliance.service"
+        unit,
+        "sed -n 's/^Environment=\"GITHUB_TOKEN=\\(.*\\)\"$/\\1/p' "
+        "/etc/systemd/system/repo-policy-compliance.service | tr -d '\\n' | sha256sum",
     )
 
-    assert (
-        return_code == 0
-    ), f"Failed to get repo-policy-compliance unit file contents {stdout} {stderr}"
+    assert return_code == 0, f"Failed to get repo-policy-compliance token hash {stdout} {stderr}"
     assert stdout is not None
-    assert f"GITHUB_TOKEN={token_alt}" in stdout
+    token_hash = stdout.split()[0]
+    assert (
+        token_hash != hashlib.sha256(b"").hexdigest()
+    ), "GITHUB_TOKEN not found in repo-policy-compliance service file"
+    assert token_hash == hashlib.sha256(token_alt.encode()).hexdigest()
 
 
 @pytest.mark.asyncio
@@ -166,7 +172,7 @@ async def test_runner_labels(
 
     test_labels = ("label_test", "additional_label", app.name)
     await app.set_config({"labels": f"{test_labels[0]}, {test_labels[1]}"})
-    await model.wait_for_idle()
+    await model.wait_for_idle(timeout=10 * 60)
 
     await wait_till_num_of_runners(unit, num=1)
 
@@ -185,7 +191,7 @@ async def test_disabled_apt_daily_upgrades(model: Model, app: Application) -> No
     act: When the runner is spawned.
     assert: No apt related background services are running.
     """
-    await model.wait_for_idle()
+    await model.wait_for_idle(timeout=10 * 60)
     unit = app.units[0]
     await wait_till_num_of_runners(unit, num=1)
     names = await get_runner_names(unit)
@@ -8,6 +8,7 @@ import logging
 from datetime import datetime, timezone
 
 import pytest
+import pytest_asyncio
 from juju.application import Application
 from juju.model import Model
 
@@ -33,86 +34,60 @@ REPO_POLICY_COMPLIANCE_VER_0_2_GIT_SOURCE = (
 )
 
 
-@pytest.mark.asyncio
-@pytest.mark.abort_on_fail
-async def test_update_dependencies_action_latest_service(
-    model: Model, app_no_runner: Application
-) -> None:
-    """
-    arrange: A working application with latest version of repo-policy-compliance service.
-    act: Run update-dependencies action.
-    assert:
-        a. Service is installed in the charm.
-        b. Action did not flushed the runners.
-    """
-    unit = app_no_runner.units[0]
-
-    action = await unit.run_action("update-dependencies")
-    await action.wait()
-    assert action.results["flush"] == "False"
-
-    await model.wait_for_idle(status=ACTIVE)
-    assert await get_repo_policy_compliance_pip_info(unit) is not None
-
-
-@pytest.mark.asyncio
-@pytest.mark.abort_on_fail
-async def test_update_dependencies_action_no_service(
-    model: Model, app_no_runner: Application
-) -> None:
-    """
-    arrange: Remove repo-policy-compliance service installation.
-    act: Run update-dependencies action.
-    assert:
-        a. Service is installed in the charm.
-        b. Action flushed the runners.
-    """
-    unit = app_no_runner.units[0]
-
-    await install_repo_policy_compliance_from_git_source(unit, None)
-    assert await get_repo_policy_compliance_pip_info(unit) is None
-
-    action = await unit.run_action("update-dependencies")
-    await action.wait()
-    await model.wait_for_idle(status=ACTIVE)
-
-    assert action.results["flush"] == "True"
-    assert await get_repo_policy_compliance_pip_info(unit) is not None
+@pytest_asyncio.fixture(scope="module", name="latest_repo_policy_compliance_pip_info")
+async def latest_repo_policy_compliance_pip_info_fixture(app_no_runner: Application) -> str:
+    """The pip info of the latest repo-policy-compliance service installed by the charm."""
+    pip_info = await get_repo_policy_compliance_pip_info(app_no_runner.units[0])
+    assert pip_info is not None, "repo-policy-compliance service not installed"
+    return pip_info
 
 
+# The cases are ordered to end with the latest service installed by the action.
+@pytest.mark.parametrize(
+    "reinstall, source, expected_flush",
+    [
+        pytest.param(False, None, "False", id="latest service"),
+        pytest.param(True, None, "True", id="no service"),
+        pytest.param(True, REPO_POLICY_COMPLIANCE_VER_0_2_GIT_SOURCE, "True", id="old service"),
+    ],
+)
 @pytest.mark.asyncio
 @pytest.mark.abort_on_fail
-async def test_update_dependencies_action_old_service(
-    model: Model, app_no_runner: Application
+async def test_update_dependencies_action_service(
+    app_no_runner: Application,
+    latest_repo_policy_compliance_pip_info: str,
+    reinstall: bool,
+    source: str | None,
+    expected_flush: str,
 ) -> None:
     """
-    arrange: Replace repo-policy-compliance service installation to a older version.
+    arrange: A working application with latest version of repo-policy-compliance service.
+        If reinstall is set, replace the service with the given source, or remove it if none.
     act: Run update-dependencies action.
     assert:
         a. Service is installed in the charm.
-        b. Action flushed the runners.
+        b. Action flushed the runners only if the service was replaced.
     """
     unit = app_no_runner.units[0]
-    latest_version_info = await get_repo_policy_compliance_pip_info(unit)
 
-    await install_repo_policy_compliance_from_git_source(
-        unit, REPO_POLICY_COMPLIANCE_VER_0_2_GIT_SOURCE
-    )
-    assert await get_repo_policy_compliance_pip_info(unit) != latest_version_info
+    if reinstall:
+        await install_repo_policy_compliance_from_git_source(unit, source)
+        pip_info = await get_repo_policy_compliance_pip_info(unit)
+        if source is None:
+            assert pip_info is None
+        else:
+            assert pip_info != latest_repo_policy_compliance_pip_info
 
     action = await unit.run_action("update-dependencies")
     await action.wait()
-    await model.wait_for_idle(status=ACTIVE)
 
-    assert action.results["flush"] == "True"
+    assert action.results["flush"] == expected_flush
     assert await get_repo_policy_compliance_pip_info(unit) is not None
 
 
 @pytest.mark.asyncio
 @pytest.mark.abort_on_fail
-async def test_update_dependencies_action_on_runner_binary(
-    model: Model, app_no_runner: Application
-) -> None:
+async def test_update_dependencies_action_on_runner_binary(app_no_runner: Application) -> None:
     """
     arrange: Remove runner binary if exists.
     act:
@@ -130,7 +105,6 @@ async def test_update_dependencies_action_on_runner_binary(
 
     action = await unit.run_action("update-dependencies")
     await action.wait()
-    await model.wait_for_idle(status=ACTIVE)
 
     # The runners should be flushed on update of runner binary.
     assert action.results["flush"] == "True"
@@ -139,7 +113,6 @@ async def test_update_dependencies_action_on_runner_binary(
 
     action = await unit.run_action("update-dependencies")
     await action.wait()
-    await model.wait_for_idle(status=ACTIVE)
 
     # The runners should be flushed on update of runner binary.
     assert action.results["flush"] == "False"
@@ -174,8 +147,7 @@ async def test_reconcile_runners(model: Model, app_no_runner: Application) -> No
     act:
         1.  a. Set virtual-machines config to 1.
             b. Run reconcile_runners action.
-        2.  a. Set virtual-machines config to 0.
-            b. Run reconcile_runners action.
+        2.  Set virtual-machines config to 0, the config change reconciles the runners.
     assert:
         1. One runner should exist.
         2. No runner should exist.
@@ -198,9 +170,8 @@ async def test_reconcile_runners(model: Model, app_no_runner: Application) -> No
     # 2.
     await app.set_config({VIRTUAL_MACHINES_CONFIG_NAME: "0"})
 
-    await reconcile(app=app, model=model)
-
-    await wait_till_num_of_runners(unit, 0)
+    # Removing idle runners is quick, poll the LXD instances closely.
+    await wait_till_num_of_runners(unit, 0, check_interval=1)
 
 
 @pytest.mark.asyncio
@@ -214,7 +185,7 @@ async def test_charm_no_runner_upgrade(
     assert: The upgrade_charm hook ran successfully and the image has not been rebuilt.
     """
     logger.info("Wait for idlle before test start")
-    await model.wait_for_idle(apps=[app_no_runner.name])
+    await model.wait_for_idle(apps=[app_no_runner.name], timeout=5 * 60)
     start_time = datetime.now(tz=timezone.utc)
 
     logger.info("Refreshing runner")
@@ -225,7 +196,7 @@ async def test_charm_no_runner_upgrade(
     await wait_for(
         functools.partial(is_upgrade_charm_event_emitted, unit), timeout=360, check_interval=60
     )
-    await model.wait_for_idle(status=ACTIVE)
+    await model.wait_for_idle(status=ACTIVE, timeout=5 * 60)
 
     logger.info("Running 'lxd image list' in unit")
     ret_code, stdout, stderr = await run_in_unit(
@@ -2,6 +2,8 @@
 # See LICENSE file for licensing details.
 
 """Integration tests for github-runner charm containing one runner."""
+import asyncio
+import json
 from typing import AsyncIterator
 
 import pytest
@@ -93,7 +95,7 @@ async def test_flush_runner_and_resource_config(
     assert action.results["offline"] == "0"
     assert action.results["unknown"] == "0"
 
-    runner_names = action.results["runners"].split(", ")
+    runner_names = json.loads(action.results["runner-names"])
     assert len(runner_names) == 1
 
     # 2.
@@ -105,29 +107,40 @@ async def test_flush_runner_and_resource_config(
     # Therefore no need to check it.
 
     # 3.
-    await app.set_config(
-        {VM_CPU_CONFIG_NAME: "1", VM_MEMORY_CONFIG_NAME: "3GiB", VM_DISK_CONFIG_NAME: "8GiB"}
-    )
+    # The values are typed as returned by get_config, vm-cpu is an int option.
+    resource_configs = {
+        VM_CPU_CONFIG_NAME: 1,
+        VM_MEMORY_CONFIG_NAME: "3GiB",
+        VM_DISK_CONFIG_NAME: "8GiB",
+    }
+    await app.set_config({name: str(value) for name, value in resource_configs.items()})
 
     # 4.
     action = await app.units[0].run_action("flush-runners")
     await action.wait()
 
-    configs = await app.get_config()
-    if instance_type == InstanceType.LOCAL_LXD:
-        await lxd.assert_resource_lxd_profile(unit, configs)
-
     action = await app.units[0].run_action("check-runners")
-    await action.wait()
+    if instance_type == InstanceType.LOCAL_LXD:
+        # Only the resource configs have changed, no need to fetch all configs again.
+        configs = {
+            **configs,
+            **{
+                name: {**configs[name], "value": value} for name, value in resource_configs.items()
+            },
+        }
+        # The checks are read only, check the LXD profile while the action runs.
+        await asyncio.gather(action.wait(), lxd.assert_resource_lxd_profile(unit, configs))
+    else:
+        await action.wait()
 
     assert action.status == "completed"
     assert action.results["online"] == "1"
     assert action.results["offline"] == "0"
     assert action.results["unknown"] == "0"
 
-    new_runner_names = action.results["runners"].split(", ")
+    new_runner_names = json.loads(action.results["runner-names"])
     assert len(new_runner_names) == 1
-    assert new_runner_names[0] != runner_names[0]
+    assert set(new_runner_names).isdisjoint(runner_names)
 
 
 @pytest.mark.openstack
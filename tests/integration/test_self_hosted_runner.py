@@ -60,7 +60,7 @@ async def test_dispatch_workflow_with_dockerhub_mirror(
     )
     action = await unit.run_action("reconcile-runners")
     await action.wait()
-    await model.wait_for_idle(status=ACTIVE)
+    await model.wait_for_idle(status=ACTIVE, timeout=5 * 60)
     names = await get_runner_names(unit)
     assert len(names) == 1
 
@@ -79,6 +79,7 @@ def mocks(monkeypatch, tmp_path, exec_command, lxd_exec_command, runner_binary_p
     monkeypatch.setattr("metrics.events.METRICS_LOG_PATH", Path(tmp_path / "metrics.log"))
     monkeypatch.setattr("runner.time", unittest.mock.MagicMock())
     monkeypatch.setattr("github_client.GhApi", MockGhapiClient)
+    monkeypatch.setattr("github_client._RUNNER_APPLICATIONS", {})
     monkeypatch.setattr("runner_manager_type.jinja2", unittest.mock.MagicMock())
     monkeypatch.setattr("runner_manager_type.LxdClient", MockLxdClient)
     monkeypatch.setattr("runner_manager.github_metrics", unittest.mock.MagicMock())
@@ -714,7 +714,13 @@ class TestCharm(unittest.TestCase):
 
         harness.charm._on_check_runners_action(mock_event)
         mock_event.set_results.assert_called_with(
-            {"online": 2, "offline": 2, "unknown": 1, "runners": "test runner 0, test runner 1"}
+            {
+                "online": 2,
+                "offline": 2,
+                "unknown": 1,
+                "runners": "test runner 0, test runner 1",
+                "runner-names": '["test runner 0", "test runner 1"]',
+            }
         )
 
     @patch("charm.RunnerManager")
@@ -973,6 +973,37 @@ def test_ssh_debug_connection_from_charm():
     assert connections[0].ed25519_fingerprint == "SHA256:ghijkl"
 
 
+@pytest.mark.parametrize(
+    "connections", [pytest.param(None, id="none"), pytest.param([], id="empty")]
+)
+def test_ssh_debug_connection_choose_no_connections(connections: list[SSHDebugConnection] | None):
+    """
+    arrange: Given no SSH debug connections.
+    act: Call SSHDebugConnection.choose method.
+    assert: No connection is chosen.
+    """
+    assert SSHDebugConnection.choose(connections) is None
+
+
+def test_ssh_debug_connection_choose():
+    """
+    arrange: Given multiple SSH debug connections.
+    act: Call SSHDebugConnection.choose method.
+    assert: One of the given connections is chosen.
+    """
+    connections = [
+        SSHDebugConnection(
+            host=f"192.168.0.{num}",  # type: ignore
+            port=22,
+            rsa_fingerprint="SHA256:abcdef",
+            ed25519_fingerprint="SHA256:ghijkl",
+        )
+        for num in range(1, 4)
+    ]
+
+    assert SSHDebugConnection.choose(connections) in connections
+
+
 def test_reactive_config_from_charm():
     """
     arrange: Mock CharmBase instance with relation data and config option set.
@@ -10,9 +10,10 @@ from urllib.error import HTTPError
 
 import pytest
 
+import github_client as github_client_module
 from charm_state import GithubRepo
 from errors import JobNotFoundError
-from github_client import GithubClient
+from github_client import RUNNER_APPLICATION_CACHE_TTL, GithubClient
 from github_type import JobConclusion, JobStats
 
 JobStatsRawData = namedtuple(
@@ -206,3 +207,50 @@ def test_github_api_http_error(github_client: GithubClient, job_stats_raw: JobSt
             workflow_run_id=secrets.token_hex(16),
             runner_name=job_stats_raw.runner_name,
         )
+
+
+def test_get_runner_application_cached(
+    github_client: GithubClient, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    arrange: A mocked GhApi object returning runner applications and a mocked clock.
+    act:
+        1. Get the runner application repeatedly.
+        2. Get the runner application with a client using another token.
+        3. Get the runner application after the cache time to live.
+    assert:
+        1. The GitHub API is requested once.
+        2. The GitHub API is requested by the other client.
+        3. The GitHub API is requested again.
+    """
+    application = {
+        "os": "linux",
+        "architecture": "x64",
+        "download_url": "https://www.example.com/runner.tgz",
+        "filename": "runner.tgz",
+    }
+    list_mock = github_client._client.actions.list_runner_applications_for_repo
+    list_mock.return_value = [application]
+    monkeypatch.setattr(github_client_module, "_RUNNER_APPLICATIONS", {})
+    monotonic_mock = MagicMock(return_value=1000)
+    monkeypatch.setattr(github_client_module.time, "monotonic", monotonic_mock)
+    path = GithubRepo("owner", "repo")
+
+    # 1.
+    assert github_client.get_runner_application(path=path, arch="x64") == application
+    assert github_client.get_runner_application(path=path, arch="x64") == application
+    list_mock.assert_called_once()
+
+    # 2.
+    other_client = GithubClient("other-token")
+    other_client._client = MagicMock()
+    other_list_mock = other_client._client.actions.list_runner_applications_for_repo
+    other_list_mock.return_value = [application]
+    assert other_client.get_runner_application(path=path, arch="x64") == application
+    other_list_mock.assert_called_once()
+    list_mock.assert_called_once()
+
+    # 3.
+    monotonic_mock.return_value = 1000 + RUNNER_APPLICATION_CACHE_TTL
+    github_client.get_runner_application(path=path, arch="x64")
+    assert list_mock.call_count == 2
@@ -1,5 +1,6 @@
 #  Copyright 2024 Canonical Ltd.
 #  See LICENSE file for licensing details.
+import dataclasses
 import random
 import secrets
 from pathlib import Path
@@ -38,6 +39,7 @@ def mock_openstack_connect_fixture(monkeypatch: pytest.MonkeyPatch) -> MagicMock
     """Mock openstack.connect."""
     mock_connect = MagicMock(spec=openstack_manager.openstack.connect)
     monkeypatch.setattr("openstack_cloud.openstack_manager.openstack.connect", mock_connect)
+    monkeypatch.setattr(openstack_manager, "_CONNECTIONS", {})
     return mock_connect
 
 
@@ -202,7 +204,7 @@ def openstack_manager_for_reconcile_fixture(
     app_name = secrets.token_hex(16)
     charm_state = MagicMock(spec=CharmState)
     charm_state.proxy_config = ProxyConfig()
-    charm_state.ssh_debug_connections = MagicMock()
+    charm_state.ssh_debug_connections = []
     charm_state.charm_config = MagicMock()
     charm_state.charm_config.repo_policy_compliance = None
     os_runner_manager_config = openstack_manager.OpenstackRunnerManagerConfig(
@@ -253,12 +255,10 @@ def test__create_connection_error(clouds_yaml: dict, openstack_connect_mock: Mag
     """
     arrange: given a monkeypatched connection.authorize() function that raises an error.
     act: when _create_connection is called.
-    assert: OpenStackUnauthorizedError is raised.
+    assert: OpenStackUnauthorizedError is raised and the connection is closed and dropped.
     """
     connection_mock = MagicMock()
-    connection_context = MagicMock()
-    connection_context.authorize.side_effect = openstack.exceptions.HttpException
-    connection_mock.__enter__.return_value = connection_context
+    connection_mock.authorize.side_effect = openstack.exceptions.HttpException
     openstack_connect_mock.return_value = connection_mock
 
     with pytest.raises(OpenStackError) as exc:
@@ -266,6 +266,21 @@ def test__create_connection_error(clouds_yaml: dict, openstack_connect_mock: Mag
             pass
 
     assert "Failed OpenStack API call" in str(exc)
+    connection_mock.close.assert_called_once()
+    assert not openstack_manager._CONNECTIONS
+
+
+def test__create_connection_no_cloud(openstack_connect_mock: MagicMock):
+    """
+    arrange: given a cloud config yaml dict with no clouds.
+    act: when _create_connection is called.
+    assert: OpenStackError is raised without connecting.
+    """
+    with pytest.raises(OpenStackError, match="No cloud defined"):
+        with openstack_manager._create_connection(cloud_config={"clouds": {}}):
+            pass
+
+    openstack_connect_mock.assert_not_called()
 
 
 def test__create_connection(
@@ -285,6 +300,26 @@ def test__create_connection(
         openstack_connect_mock.assert_called_with(cloud=cloud_name)
 
 
+def test__create_connection_reuse(clouds_yaml: dict, openstack_connect_mock: MagicMock):
+    """
+    arrange: given a cloud config yaml dict.
+    act: when _create_connection is called twice and then close_connections is called.
+    assert: the connection is created once, reused and closed.
+    """
+    with openstack_manager._create_connection(cloud_config=clouds_yaml) as first_conn:
+        pass
+    with openstack_manager._create_connection(cloud_config=clouds_yaml) as second_conn:
+        pass
+
+    assert first_conn is second_conn
+    openstack_connect_mock.assert_called_once()
+
+    openstack_manager.close_connections()
+
+    first_conn.close.assert_called_once()
+    assert not openstack_manager._CONNECTIONS
+
+
 @pytest.mark.parametrize(
     "proxy_config, dockerhub_mirror, ssh_debug_connections, expected_env_contents",
     [
@@ -425,6 +460,27 @@ def test__generate_runner_env(
     )
 
 
+def test_create_instance_config():
+    """
+    arrange: given configuration values with labels in a list.
+    act: when create_instance_config is called.
+    assert: the instance config holds the labels in a tuple and is immutable.
+    """
+    instance_config = openstack_manager.create_instance_config(
+        app_name="test-app",
+        unit_num=0,
+        image_id="test-image-id",
+        path=MagicMock(),
+        labels=["label1", "label2"],
+        registration_token="test-token",
+    )
+
+    assert instance_config.labels == ("label1", "label2")
+    assert instance_config.name.startswith("test-app-0-")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        instance_config.name = "other-name"  # type: ignore[misc]
+
+
 def test_reconcile_issues_runner_installed_event(
     openstack_manager_for_reconcile: openstack_manager.OpenstackRunnerManager,
 ):
@@ -448,6 +504,39 @@ def test_reconcile_issues_runner_installed_event(
     )
 
 
+def test_reconcile_ensures_security_group_once(
+    openstack_manager_for_reconcile: openstack_manager.OpenstackRunnerManager,
+    patched_create_connection_context: MagicMock,
+):
+    """
+    arrange: Mock openstack manager for reconcile.
+    act: Reconcile to create three runners.
+    assert: The security group is looked up once.
+    """
+    openstack_manager.Pool.return_value.map.side_effect = lambda func, iterable: [
+        func(args) for args in iterable
+    ]
+
+    openstack_manager_for_reconcile.reconcile(quantity=3)
+
+    assert patched_create_connection_context.create_server.call_count == 3
+    patched_create_connection_context.list_security_groups.assert_called_once()
+
+
+def test_reconcile_no_scale_up_skips_registration_token(
+    openstack_manager_for_reconcile: openstack_manager.OpenstackRunnerManager,
+    mock_github_client: MagicMock,
+):
+    """
+    arrange: Mock openstack manager for reconcile without any servers.
+    act: Reconcile with quantity of zero.
+    assert: No registration token is requested from GitHub.
+    """
+    openstack_manager_for_reconcile.reconcile(quantity=0)
+
+    mock_github_client.get_runner_registration_token.assert_not_called()
+
+
 def test_reconcile_places_timestamp_in_metrics_storage(
     openstack_manager_for_reconcile: openstack_manager.OpenstackRunnerManager,
     monkeypatch: pytest.MonkeyPatch,
@@ -693,6 +782,9 @@ def test_reconcile_ignores_metrics_for_openstack_online_runners(
         metrics_storage_manager=metrics.storage,
         ignore_runners=set(openstack_online_runner_names),
     )
+    patched_create_connection_context.list_servers.assert_called_with(
+        filters={"name": f"^{instance_name}-"}
+    )
 
 
 def test_reconcile_reactive_mode(
@@ -719,6 +811,61 @@ def test_reconcile_reactive_mode(
     )
 
 
+def test__get_openstack_runner_status(
+    openstack_manager_for_reconcile: openstack_manager.OpenstackRunnerManager,
+    patched_create_connection_context: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    arrange: Given OpenStack servers of which some fail the health check.
+    act: Get the runner status.
+    assert: The runners are grouped by health in the order of the servers.
+    """
+    instance_name = openstack_manager_for_reconcile.instance_name
+    names = [f"{instance_name}-{i}" for i in range(5)]
+    patched_create_connection_context.list_servers.return_value = [
+        factories.MockOpenstackServer(name=name) for name in names
+    ]
+    monkeypatch.setattr(
+        openstack_manager.OpenstackRunnerManager,
+        "_health_check",
+        MagicMock(side_effect=lambda conn, server_name: server_name not in names[1::2]),
+    )
+
+    runner_by_health = openstack_manager_for_reconcile._get_openstack_runner_status(
+        patched_create_connection_context
+    )
+
+    assert runner_by_health == RunnerByHealth(
+        healthy=(names[0], names[2], names[4]), unhealthy=(names[1], names[3])
+    )
+
+
+def test__remove_runners(
+    openstack_manager_for_reconcile: openstack_manager.OpenstackRunnerManager,
+    patched_create_connection_context: MagicMock,
+):
+    """
+    arrange: Mock the removal of a single runner to fail for one of the runners.
+    act: Remove two out of three runners.
+    assert: Only the first two runners are removed, the failure does not stop the removal of \
+        the other runner and is raised afterwards.
+    """
+    remove_one_runner_mock = MagicMock(side_effect=[None, OpenStackError("Mock error")])
+    openstack_manager_for_reconcile._remove_one_runner = remove_one_runner_mock
+
+    with pytest.raises(OpenStackError):
+        openstack_manager_for_reconcile._remove_runners(
+            conn=patched_create_connection_context,
+            instance_names=("runner-0", "runner-1", "runner-2"),
+            num_to_remove=2,
+        )
+
+    assert remove_one_runner_mock.call_count == 2
+    removed = {call_args.args[1] for call_args in remove_one_runner_mock.call_args_list}
+    assert removed == {"runner-0", "runner-1"}
+
+
 def test_repo_policy_config(
     openstack_manager_for_reconcile: openstack_manager.OpenstackRunnerManager,
     monkeypatch: pytest.MonkeyPatch,
@@ -3,6 +3,7 @@
 
 """Test cases of Runner class."""
 
+import json
 import secrets
 import unittest
 from pathlib import Path
@@ -23,7 +24,14 @@ from errors import (
 )
 from lxd import LxdInstance, LxdInstanceFileManager
 from metrics.storage import MetricsStorage
-from runner import DIAG_DIR_PATH, CreateRunnerConfig, Runner, RunnerConfig, RunnerStatus
+from runner import (
+    DIAG_DIR_PATH,
+    CreateRunnerConfig,
+    Runner,
+    RunnerConfig,
+    RunnerStatus,
+    _render_docker_proxy_assets,
+)
 from runner_manager_type import RunnerManagerClients
 from runner_type import ProxySetting
 from tests.unit.factories import SSHDebugInfoFactory
@@ -560,3 +568,26 @@ def test_pull_logs_lxd_error(runner: Runner):
 
     assert "Cannot pull the logs for test-runner." in str(exc_info.value)
     assert "Cannot pull file" in str(exc_info.value.__cause__)
+
+
+def test_render_docker_proxy_assets():
+    """
+    arrange: Given a jinja2 environment with the charm templates and proxy settings.
+    act: Render the docker proxy configurations twice.
+    assert: The configurations contain the set proxies, and the second call is cached.
+    """
+    environment = jinja2.Environment(loader=jinja2.FileSystemLoader("templates"), autoescape=True)
+    _render_docker_proxy_assets.cache_clear()
+
+    service_conf, client_config = _render_docker_proxy_assets(
+        environment, TEST_PROXY_SERVER_URL, None, "test_no_proxy"
+    )
+    _render_docker_proxy_assets(environment, TEST_PROXY_SERVER_URL, None, "test_no_proxy")
+
+    assert f'Environment="HTTP_PROXY={TEST_PROXY_SERVER_URL}"' in service_conf
+    assert "HTTPS_PROXY" not in service_conf
+    assert 'Environment="NO_PROXY=test_no_proxy"' in service_conf
+    assert json.loads(client_config) == {
+        "proxies": {"default": {"httpProxy": TEST_PROXY_SERVER_URL, "noProxy": "test_no_proxy"}}
+    }
+    assert _render_docker_proxy_assets.cache_info().hits == 1
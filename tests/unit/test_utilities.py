@@ -4,12 +4,12 @@
 """Test cases of utilities."""
 
 from subprocess import CalledProcessError  # nosec B404
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 import pytest
 
 from errors import SubprocessError
-from utilities import execute_command
+from utilities import execute_command, retry
 
 
 def test_execute_command_with_error(monkeypatch):
@@ -38,3 +38,20 @@ def test_execute_command_with_error(monkeypatch):
 
     with pytest.raises(SubprocessError):
         execute_command(["mock", "cmd"])
+
+
+def test_retry_with_jitter(monkeypatch):
+    """
+    arrange: Set up a function that fails twice before succeeding, with retry and jitter.
+    act: Call the function.
+    assert: The waits between tries are the backoff delays scaled by the jitter factor.
+    """
+    sleep_mock = MagicMock()
+    monkeypatch.setattr("utilities.time.sleep", sleep_mock)
+    monkeypatch.setattr("utilities.random.uniform", MagicMock(return_value=1.5))
+    func = MagicMock(side_effect=[ValueError, ValueError, "done"])
+
+    result = retry(tries=3, delay=2, backoff=2, jitter=(0.5, 1.5))(func)()
+
+    assert result == "done"
+    assert sleep_mock.call_args_list == [call(3), call(6)]